@@ -1,11 +1,61 @@
 import os
 import json
-import datetime
+import logging
 import re
+import heapq
+import shutil
+import base64
+import binascii
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # orjson serializes/deserializes message dicts several times faster than
+    # stdlib json and always emits UTF-8, so no ensure_ascii handling needed
+    def _json_dumps(obj) -> str:
+        """Serialize to a compact JSON string."""
+        return orjson.dumps(obj).decode('utf-8')
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> str:
+        """Serialize to a compact JSON string."""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+    _json_loads = json.loads
+
+# Data-URL payloads (images, PDFs) are stored once as raw bytes under the
+# session's attachments/ dir and referenced by content hash in the log
+_ATTACHMENT_SCHEME = "attachment://"
+_MIME_TO_EXT = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "application/pdf": ".pdf",
+}
+_EXT_TO_MIME = {ext: mime for mime, ext in _MIME_TO_EXT.items()}
+
+_log = logging.getLogger(__name__)
+
+# Bound for the per-session caches; parsed conversations hold their full
+# history (re-inlined attachments included), so they must not accumulate
+# for every session a long-running process ever touched
+_CACHE_MAX_SESSIONS = 32
+
+# Compiled once; _sanitize_filename runs on every new-session creation
+_SANITIZE_STRIP = re.compile(r'[^\w\s-]')
+_SANITIZE_COLLAPSE = re.compile(r'[-\s]+')
+
 class ChatSessionManager:
     """
     Manages chat sessions for the OpenRouter node.
@@ -26,6 +76,15 @@ class ChatSessionManager:
         self.base_path.mkdir(exist_ok=True)
         self.current_session_path = None
         self.session_timeout_hours = 1  # Sessions expire after 1 hour of inactivity
+        # LRU-bounded (_CACHE_MAX_SESSIONS) per-session caches
+        # Metadata: Path -> (meta.json st_mtime_ns, meta dict)
+        self._session_meta = OrderedDict()
+        # Parsed conversations: Path -> (st_mtime_ns, byte offset, messages)
+        self._conv_cache = OrderedDict()
+        # Signature of the last saved state, for no-op detection
+        self._last_saved_sig = OrderedDict()
+        # Cached append-mode handle for the active session: (Path, file object)
+        self._append_handle = None
     
     def _sanitize_filename(self, text: str, max_length: int = 50) -> str:
         """
@@ -43,8 +102,8 @@ class ChatSessionManager:
         text = " ".join(words)
         
         # Remove special characters
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[-\s]+', '_', text)
+        text = _SANITIZE_STRIP.sub('', text)
+        text = _SANITIZE_COLLAPSE.sub('_', text)
         
         # Truncate to max length
         if len(text) > max_length:
@@ -54,40 +113,357 @@ class ChatSessionManager:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp in format YYYYMMDD_HHMMSS"""
-        return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return time.strftime("%Y%m%d_%H%M%S")
     
-    def _get_iso_timestamp(self) -> str:
-        """Get current timestamp in ISO format"""
-        return datetime.datetime.now().isoformat()
+    def _now_iso(self) -> str:
+        """
+        Get current timestamp in ISO format.
+
+        Formats via time.strftime directly, skipping the datetime object
+        allocation that datetime.now().isoformat() would pay on every message.
+        """
+        t = time.time()
+        return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(t)) + f".{int(t % 1 * 1e6):06d}"
     
+    def _cache_put(self, cache: OrderedDict, key, value):
+        """
+        Insert into a bounded cache, evicting the least recently used entry.
+
+        Args:
+            cache: One of the per-session OrderedDict caches
+            key: Cache key (session path)
+            value: Value to store
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _CACHE_MAX_SESSIONS:
+            cache.popitem(last=False)
+
+    def _conversation_file(self, session_path: Path) -> Optional[Path]:
+        """
+        Get the conversation file for a session, preferring the JSONL format.
+
+        Args:
+            session_path: Path to the session directory
+
+        Returns:
+            Path to conversation.jsonl, legacy conversation.json, or None
+        """
+        jsonl_file = session_path / "conversation.jsonl"
+        if jsonl_file.exists():
+            return jsonl_file
+
+        legacy_file = session_path / "conversation.json"
+        if legacy_file.exists():
+            return legacy_file
+
+        return None
+
+    def _read_meta(self, session_path: Path) -> Optional[Dict]:
+        """
+        Read the session metadata sidecar file.
+
+        Args:
+            session_path: Path to the session directory
+
+        Returns:
+            Metadata dictionary or None if missing/unreadable
+        """
+        meta_file = session_path / "meta.json"
+
+        try:
+            mtime_ns = meta_file.stat().st_mtime_ns
+        except OSError:
+            self._session_meta.pop(session_path, None)
+            return None
+
+        # Serve from cache unless another writer touched the file
+        cached = self._session_meta.get(session_path)
+        if cached is not None and cached[0] == mtime_ns:
+            self._session_meta.move_to_end(session_path)
+            return cached[1]
+
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                meta = _json_loads(f.read())
+        except (json.JSONDecodeError, IOError):
+            return None
+
+        self._cache_put(self._session_meta, session_path, (mtime_ns, meta))
+        return meta
+
+    def _write_meta(self, session_path: Path, meta: Dict):
+        """
+        Write the session metadata sidecar file.
+
+        Args:
+            session_path: Path to the session directory
+            meta: Metadata dictionary to write
+        """
+        meta_file = session_path / "meta.json"
+
+        try:
+            with open(meta_file, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(meta))
+        except IOError:
+            _log.exception("Error writing session metadata to %s", meta_file)
+            return
+
+        try:
+            self._cache_put(self._session_meta, session_path, (meta_file.stat().st_mtime_ns, meta))
+        except OSError:
+            self._session_meta.pop(session_path, None)
+
+    def _load_legacy_data(self, session_path: Path) -> Optional[Dict]:
+        """
+        Load a legacy monolithic conversation.json file if present.
+
+        Args:
+            session_path: Path to the session directory
+
+        Returns:
+            Full conversation data dictionary or None
+        """
+        legacy_file = session_path / "conversation.json"
+
+        if not legacy_file.exists():
+            return None
+
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                return _json_loads(f.read())
+        except (json.JSONDecodeError, IOError):
+            _log.exception("Error loading conversation from %s", legacy_file)
+            return None
+
+    def _store_attachment(self, session_path: Path, data_url: str) -> Optional[str]:
+        """
+        Store a data-URL payload as raw bytes in the session's attachments dir.
+
+        Files are named by content hash, so the same image or PDF attached on
+        several turns is stored exactly once.
+
+        Args:
+            session_path: Path to the session directory
+            data_url: data: URL with a base64-encoded payload
+
+        Returns:
+            attachment:// reference string, or None if the payload cannot be
+            externalized (unknown mime type, malformed base64)
+        """
+        header, sep, payload = data_url.partition(',')
+        if not sep or ';base64' not in header:
+            return None
+
+        ext = _MIME_TO_EXT.get(header[5:].split(';')[0])
+        if ext is None:
+            return None
+
+        try:
+            raw = base64.b64decode(payload)
+        except (binascii.Error, ValueError):
+            return None
+
+        name = hashlib.sha1(raw).hexdigest() + ext
+        attachment_file = session_path / "attachments" / name
+
+        if not attachment_file.exists():
+            try:
+                attachment_file.parent.mkdir(exist_ok=True)
+                with open(attachment_file, 'wb') as f:
+                    f.write(raw)
+            except IOError:
+                _log.exception("Error storing attachment %s", attachment_file)
+                return None
+
+        return _ATTACHMENT_SCHEME + name
+
+    def _load_attachment(self, session_path: Path, ref: str) -> Optional[str]:
+        """
+        Rebuild a data URL from an attachment:// reference.
+
+        Args:
+            session_path: Path to the session directory
+            ref: attachment:// reference produced by _store_attachment
+
+        Returns:
+            data: URL string, or None if the attachment file is missing
+        """
+        name = ref[len(_ATTACHMENT_SCHEME):]
+        mime = _EXT_TO_MIME.get(os.path.splitext(name)[1])
+        if mime is None or os.sep in name or '/' in name:
+            return None
+
+        try:
+            with open(session_path / "attachments" / name, 'rb') as f:
+                raw = f.read()
+        except IOError:
+            return None
+
+        return f"data:{mime};base64,{base64.b64encode(raw).decode('ascii')}"
+
+    def _externalize_attachments(self, session_path: Path, message: Dict) -> Dict:
+        """
+        Replace inline data-URL payloads in a message with attachment refs.
+
+        Returns copies rather than mutating, so the caller's in-memory
+        messages keep their inline payloads.
+
+        Args:
+            session_path: Path to the session directory
+            message: Message dictionary about to be persisted
+
+        Returns:
+            Message safe to persist (the original if nothing was externalized)
+        """
+        content = message.get("content")
+        if not isinstance(content, list):
+            return message
+
+        new_blocks = None
+        for i, block in enumerate(content):
+            if not isinstance(block, dict):
+                continue
+
+            if block.get("type") == "image_url":
+                url = block.get("image_url", {}).get("url", "")
+                if isinstance(url, str) and url.startswith("data:"):
+                    ref = self._store_attachment(session_path, url)
+                    if ref is not None:
+                        if new_blocks is None:
+                            new_blocks = list(content)
+                        new_blocks[i] = {"type": "image_url", "image_url": {"url": ref}}
+            elif block.get("type") == "file":
+                file_data = block.get("file", {}).get("file_data", "")
+                if isinstance(file_data, str) and file_data.startswith("data:"):
+                    ref = self._store_attachment(session_path, file_data)
+                    if ref is not None:
+                        if new_blocks is None:
+                            new_blocks = list(content)
+                        new_file = dict(block["file"], file_data=ref)
+                        new_blocks[i] = dict(block, file=new_file)
+
+        if new_blocks is None:
+            return message
+
+        return dict(message, content=new_blocks)
+
+    def _resolve_attachments(self, session_path: Path, message: Dict) -> Dict:
+        """
+        Replace attachment refs in a loaded message with inline data URLs.
+
+        Args:
+            session_path: Path to the session directory
+            message: Message dictionary read from the log
+
+        Returns:
+            Message with inline payloads restored (refs whose files are
+            missing are left untouched)
+        """
+        content = message.get("content")
+        if not isinstance(content, list):
+            return message
+
+        new_blocks = None
+        for i, block in enumerate(content):
+            if not isinstance(block, dict):
+                continue
+
+            if block.get("type") == "image_url":
+                url = block.get("image_url", {}).get("url", "")
+                if isinstance(url, str) and url.startswith(_ATTACHMENT_SCHEME):
+                    data_url = self._load_attachment(session_path, url)
+                    if data_url is not None:
+                        if new_blocks is None:
+                            new_blocks = list(content)
+                        new_blocks[i] = {"type": "image_url", "image_url": {"url": data_url}}
+            elif block.get("type") == "file":
+                file_data = block.get("file", {}).get("file_data", "")
+                if isinstance(file_data, str) and file_data.startswith(_ATTACHMENT_SCHEME):
+                    data_url = self._load_attachment(session_path, file_data)
+                    if data_url is not None:
+                        if new_blocks is None:
+                            new_blocks = list(content)
+                        new_file = dict(block["file"], file_data=data_url)
+                        new_blocks[i] = dict(block, file=new_file)
+
+        if new_blocks is None:
+            return message
+
+        return dict(message, content=new_blocks)
+
+    def _iter_sessions(self) -> List[Tuple[str, float]]:
+        """
+        Enumerate session directories in a single scandir pass.
+
+        Uses DirEntry.stat, which is served from the directory read on Linux,
+        instead of issuing a separate stat syscall per entry.
+
+        Returns:
+            List of (directory_name, mtime) tuples
+        """
+        entries = []
+        try:
+            with os.scandir(self.base_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            entries.append((entry.name, entry.stat(follow_symlinks=False).st_mtime))
+                    except OSError:
+                        continue
+        except OSError:
+            return []
+        return entries
+
     def _find_active_session(self) -> Optional[Path]:
         """
         Find an active session within the timeout period.
-        
+
         Returns:
             Path to active session directory or None
         """
-        if not self.base_path.exists():
+        entries = self._iter_sessions()
+        if not entries:
             return None
-        
-        current_time = time.time()
-        
-        # Get all session directories
-        sessions = [d for d in self.base_path.iterdir() if d.is_dir()]
-        
-        # Sort by modification time (most recent first)
-        sessions.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        
-        for session_dir in sessions:
-            conversation_file = session_dir / "conversation.json"
-            if conversation_file.exists():
-                # Check if session is within timeout period
-                last_modified = conversation_file.stat().st_mtime
-                hours_elapsed = (current_time - last_modified) / 3600
-                
-                if hours_elapsed <= self.session_timeout_hours:
-                    return session_dir
-        
+
+        # The most recent directory is almost always the active session;
+        # picking it via nlargest avoids sorting the whole list
+        top = heapq.nlargest(1, entries, key=lambda e: e[1])
+        active = self._check_session_active(top[0][0])
+        if active is not None:
+            return active
+
+        # Rare path: the newest directory wasn't usable, scan the rest
+        entries.sort(key=lambda e: e[1], reverse=True)
+        for name, _ in entries[1:]:
+            active = self._check_session_active(name)
+            if active is not None:
+                return active
+
+        return None
+
+    def _check_session_active(self, name: str) -> Optional[Path]:
+        """
+        Check whether a session directory is within the timeout period.
+
+        Args:
+            name: Session directory name relative to the base path
+
+        Returns:
+            Path to the session directory if active, otherwise None
+        """
+        session_dir = self.base_path / name
+        conversation_file = self._conversation_file(session_dir)
+        if conversation_file is None:
+            return None
+
+        # Check if session is within timeout period
+        last_modified = conversation_file.stat().st_mtime
+        hours_elapsed = (time.time() - last_modified) / 3600
+
+        if hours_elapsed <= self.session_timeout_hours:
+            return session_dir
+
         return None
     
     def _create_new_session(self, first_message: str) -> Path:
@@ -106,14 +482,15 @@ class ChatSessionManager:
         # Create session directory name
         session_name = f"session_{timestamp}_{sanitized_message}"
         session_path = self.base_path / session_name
-        
-        # Handle potential naming conflicts
-        counter = 1
-        while session_path.exists():
-            session_path = self.base_path / f"{session_name}_{counter}"
-            counter += 1
-        
-        session_path.mkdir(exist_ok=True)
+
+        # mkdir both detects and resolves naming conflicts in one syscall;
+        # a random suffix makes a second collision effectively impossible
+        try:
+            session_path.mkdir()
+        except FileExistsError:
+            session_path = self.base_path / f"{session_name}_{os.urandom(3).hex()}"
+            session_path.mkdir()
+
         return session_path
     
     def get_or_create_session(self, user_message: str, system_prompt: str) -> Tuple[Path, List[Dict]]:
@@ -141,19 +518,26 @@ class ChatSessionManager:
             
             # Initialize with system prompt
             messages = [{"role": "system", "content": system_prompt}]
-            
-            # Create initial conversation file
-            conversation_data = {
+
+            # Create the message log and metadata sidecar
+            conversation_file = new_session / "conversation.jsonl"
+            try:
+                with open(conversation_file, 'w', encoding='utf-8') as f:
+                    f.write(_json_dumps(messages[0]) + "\n")
+            except IOError:
+                _log.exception("Error creating conversation file %s", conversation_file)
+
+            self._refresh_conv_cache(new_session, list(messages))
+
+            now = self._now_iso()
+            self._write_meta(new_session, {
                 "session_id": new_session.name,
-                "created_at": self._get_iso_timestamp(),
-                "last_updated": self._get_iso_timestamp(),
-                "messages": messages
-            }
-            
-            conversation_file = new_session / "conversation.json"
-            with open(conversation_file, 'w', encoding='utf-8') as f:
-                json.dump(conversation_data, f, indent=2, ensure_ascii=False)
-            
+                "created_at": now,
+                "last_updated": now,
+                "first_message_hash": self._first_message_hash(messages),
+                "message_count": len(messages)
+            })
+
             return new_session, messages
     
     def load_conversation(self, session_path: Path) -> List[Dict]:
@@ -166,57 +550,292 @@ class ChatSessionManager:
         Returns:
             List of messages in the conversation
         """
-        conversation_file = session_path / "conversation.json"
-        
-        if not conversation_file.exists():
+        conversation_file = session_path / "conversation.jsonl"
+
+        try:
+            st = conversation_file.stat()
+        except OSError:
+            self._conv_cache.pop(session_path, None)
+            # Legacy fallback: monolithic conversation.json
+            legacy_data = self._load_legacy_data(session_path)
+            if legacy_data is not None:
+                return legacy_data.get("messages", [])
             return []
-        
+
+        cached = self._conv_cache.get(session_path)
+        if cached is not None:
+            self._conv_cache.move_to_end(session_path)
+            cached_mtime_ns, cached_offset, messages = cached
+
+            if cached_mtime_ns == st.st_mtime_ns and cached_offset == st.st_size:
+                return list(messages)
+
+            if st.st_size > cached_offset:
+                # File only grew: parse just the newly appended lines. The
+                # read is bounded to the stat'd size so a concurrent append
+                # landing mid-read can't advance past the recorded offset
+                # and get parsed twice on the next call.
+                try:
+                    with open(conversation_file, 'rb') as f:
+                        f.seek(cached_offset)
+                        tail = f.read(st.st_size - cached_offset)
+                    for line in tail.splitlines():
+                        line = line.strip()
+                        if line:
+                            messages.append(self._resolve_attachments(session_path, _json_loads(line)))
+                except (ValueError, IOError):
+                    self._conv_cache.pop(session_path, None)
+                else:
+                    self._cache_put(self._conv_cache, session_path, (st.st_mtime_ns, st.st_size, messages))
+                    return list(messages)
+            else:
+                # File shrank (history truncated): fall back to a full parse
+                self._conv_cache.pop(session_path, None)
+
+        messages = []
         try:
-            with open(conversation_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get("messages", [])
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading conversation from {conversation_file}: {e}")
+            # Bounded like the incremental path, so the cached offset always
+            # matches exactly what was parsed
+            with open(conversation_file, 'rb') as f:
+                data = f.read(st.st_size)
+            for line in data.splitlines():
+                line = line.strip()
+                if line:
+                    messages.append(self._resolve_attachments(session_path, _json_loads(line)))
+        except (ValueError, IOError):
+            _log.exception("Error loading conversation from %s", conversation_file)
             return []
-    
+
+        self._cache_put(self._conv_cache, session_path, (st.st_mtime_ns, st.st_size, messages))
+        return list(messages)
+
     def save_conversation(self, session_path: Path, messages: List[Dict]):
         """
         Save conversation history to a session.
-        
+
+        Only messages beyond what is already on disk are appended, so the
+        per-turn write cost stays constant regardless of history length.
+
         Args:
             session_path: Path to the session directory
             messages: List of messages to save
         """
-        conversation_file = session_path / "conversation.json"
-        
-        # Load existing data to preserve metadata
-        existing_data = {}
-        if conversation_file.exists():
+        conversation_file = session_path / "conversation.jsonl"
+
+        # Callers may edit already-persisted messages in place (node.py
+        # rewrites messages[0] when the system prompt changes); hash the
+        # first message so such edits are detected and fully rewritten
+        first_hash = self._first_message_hash(messages)
+
+        # No-op saves happen when upstream flows double-invoke (e.g. UI
+        # re-renders); skip all I/O if the state matches the last save
+        sig = (len(messages), id(messages[-1]) if messages else None, first_hash)
+        if self._last_saved_sig.get(session_path) == sig:
+            return
+
+        now = self._now_iso()
+        meta = self._read_meta(session_path)
+        if meta is None:
+            # Migrating a legacy session (or recovering from a lost sidecar):
+            # preserve its metadata, and rewrite the full log as JSONL
+            legacy_data = self._load_legacy_data(session_path) or {}
+            meta = {
+                "session_id": legacy_data.get("session_id", session_path.name),
+                "created_at": legacy_data.get("created_at", now),
+                "message_count": 0
+            }
+
+        saved_count = meta.get("message_count", 0)
+        if not conversation_file.exists():
+            saved_count = 0
+
+        # An already-persisted head that no longer matches means an in-place
+        # edit; appending the tail alone would silently drop it
+        prefix_changed = saved_count > 0 and meta.get("first_message_hash") != first_hash
+
+        try:
+            if len(messages) < saved_count or prefix_changed:
+                # History was truncated or edited upstream; rewrite the log
+                self._close_append_handle()
+                with open(conversation_file, 'w', encoding='utf-8') as f:
+                    f.write(''.join(
+                        _json_dumps(self._externalize_attachments(session_path, msg)) + "\n"
+                        for msg in messages
+                    ))
+            elif len(messages) > saved_count:
+                self._append_lines(session_path, ''.join(
+                    _json_dumps(self._externalize_attachments(session_path, msg)) + "\n"
+                    for msg in messages[saved_count:]
+                ))
+        except IOError:
+            _log.exception("Error saving conversation to %s", conversation_file)
+            return
+
+        self._refresh_conv_cache(session_path, list(messages))
+
+        meta["message_count"] = len(messages)
+        meta["last_updated"] = now
+        meta["first_message_hash"] = first_hash
+        self._record_first_user_message(meta, messages)
+        self._write_meta(session_path, meta)
+        self._cache_put(self._last_saved_sig, session_path, sig)
+
+    def _append_lines(self, session_path: Path, text: str):
+        """
+        Append pre-serialized JSONL text through a cached file handle.
+
+        Streaming appends to the active session reuse one open handle and
+        issue a single buffered write per call, instead of paying an
+        open/write/close syscall triple for every message.
+
+        Args:
+            session_path: Path to the session directory
+            text: One or more serialized JSONL lines, newline-terminated
+        """
+        if self._append_handle is not None and self._append_handle[0] != session_path:
+            self._close_append_handle()
+
+        if self._append_handle is None:
+            f = open(session_path / "conversation.jsonl", 'a', encoding='utf-8')
+            self._append_handle = (session_path, f)
+
+        try:
+            self._append_handle[1].write(text)
+            self._append_handle[1].flush()
+        except IOError:
+            self._close_append_handle()
+            raise
+
+    def _close_append_handle(self):
+        """Close the cached append handle, if any."""
+        if self._append_handle is not None:
             try:
-                with open(conversation_file, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                self._append_handle[1].close()
+            except IOError:
                 pass
-        
-        # Update conversation data
-        conversation_data = {
-            "session_id": existing_data.get("session_id", session_path.name),
-            "created_at": existing_data.get("created_at", self._get_iso_timestamp()),
-            "last_updated": self._get_iso_timestamp(),
-            "messages": messages
-        }
-        
-        # Save to file
+            self._append_handle = None
+
+    def close(self):
+        """Release the cached append handle. Safe to call more than once."""
+        self._close_append_handle()
+
+    def __del__(self):
+        self._close_append_handle()
+
+    def _refresh_conv_cache(self, session_path: Path, messages: List[Dict]):
+        """
+        Update the parsed-conversation cache after a write we performed.
+
+        Args:
+            session_path: Path to the session directory
+            messages: Message list matching the file contents
+        """
         try:
-            with open(conversation_file, 'w', encoding='utf-8') as f:
-                json.dump(conversation_data, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"Error saving conversation to {conversation_file}: {e}")
-    
+            st = (session_path / "conversation.jsonl").stat()
+        except OSError:
+            self._conv_cache.pop(session_path, None)
+            return
+        self._cache_put(self._conv_cache, session_path, (st.st_mtime_ns, st.st_size, messages))
+
+    def _first_message_hash(self, messages: List[Dict]) -> Optional[str]:
+        """
+        Hash the first message of a conversation for in-place edit detection.
+
+        Args:
+            messages: Full message list
+
+        Returns:
+            Hex digest of the serialized first message, or None if empty
+        """
+        if not messages:
+            return None
+        return hashlib.sha1(_json_dumps(messages[0]).encode('utf-8')).hexdigest()
+
+    def _first_user_preview(self, content) -> str:
+        """
+        Get a short preview string for a user message's content.
+
+        Args:
+            content: Message content (string or multimodal block list)
+
+        Returns:
+            First 100 characters of the message text
+        """
+        if isinstance(content, list):
+            # Multimodal content: use the first text block
+            content = next(
+                (block.get("text", "") for block in content
+                 if isinstance(block, dict) and block.get("type") == "text"),
+                ""
+            )
+        if not isinstance(content, str):
+            content = str(content)
+        return content[:100]
+
+    def _record_first_user_message(self, meta: Dict, messages: List[Dict]):
+        """
+        Record the first user message preview in session metadata, if missing.
+
+        Args:
+            meta: Metadata dictionary to update in place
+            messages: Newly appended messages to scan
+        """
+        if "first_user_message" in meta:
+            return
+        for msg in messages:
+            if msg.get("role") == "user":
+                meta["first_user_message"] = self._first_user_preview(msg.get("content", ""))
+                return
+
+    def append_message_jsonl(self, session_path: Path, message: Dict, now: Optional[str] = None):
+        """
+        Append a single message to a session's JSONL log.
+
+        Args:
+            session_path: Path to the session directory
+            message: Message dictionary to append
+            now: Optional precomputed ISO timestamp to reuse for the meta update
+        """
+        conversation_file = session_path / "conversation.jsonl"
+
+        try:
+            self._append_lines(
+                session_path,
+                _json_dumps(self._externalize_attachments(session_path, message)) + "\n"
+            )
+        except IOError:
+            _log.exception("Error appending message to %s", conversation_file)
+            return
+
+        cached = self._conv_cache.get(session_path)
+        if cached is not None:
+            cached[2].append(message)
+            self._refresh_conv_cache(session_path, cached[2])
+
+        if now is None:
+            now = self._now_iso()
+
+        meta = self._read_meta(session_path)
+        if meta is None:
+            meta = {
+                "session_id": session_path.name,
+                "created_at": now,
+                "message_count": 0
+            }
+        meta["message_count"] = meta.get("message_count", 0) + 1
+        meta["last_updated"] = now
+        if meta["message_count"] == 1:
+            meta["first_message_hash"] = self._first_message_hash([message])
+        self._record_first_user_message(meta, [message])
+        self._write_meta(session_path, meta)
+        # Direct appends change the on-disk state behind save_conversation's
+        # no-op signature, so force the next save to re-check
+        self._last_saved_sig.pop(session_path, None)
+
     def append_message(self, role: str, content: str, session_path: Optional[Path] = None):
         """
         Append a message to the current or specified session.
-        
+
         Args:
             role: Message role ('user', 'assistant', or 'system')
             content: Message content
@@ -224,22 +843,26 @@ class ChatSessionManager:
         """
         if session_path is None:
             session_path = self.current_session_path
-        
+
         if session_path is None:
             raise ValueError("No active session to append message to")
-        
-        # Load existing messages
-        messages = self.load_conversation(session_path)
-        
-        # Append new message
-        messages.append({
+
+        now = self._now_iso()
+        message = {
             "role": role,
             "content": content,
-            "timestamp": self._get_iso_timestamp()
-        })
-        
-        # Save updated conversation
-        self.save_conversation(session_path, messages)
+            "timestamp": now
+        }
+
+        if not (session_path / "conversation.jsonl").exists() and \
+                (session_path / "conversation.json").exists():
+            # Legacy session: migrate to JSONL via the full-save path
+            messages = self.load_conversation(session_path)
+            messages.append(message)
+            self.save_conversation(session_path, messages)
+            return
+
+        self.append_message_jsonl(session_path, message, now=now)
     
     def get_recent_sessions(self, limit: int = 10) -> List[Dict]:
         """
@@ -251,37 +874,149 @@ class ChatSessionManager:
         Returns:
             List of session metadata dictionaries
         """
-        if not self.base_path.exists():
+        entries = self._iter_sessions()
+        if not entries:
             return []
-        
-        sessions = []
-        session_dirs = [d for d in self.base_path.iterdir() if d.is_dir()]
-        
-        # Sort by modification time (most recent first)
-        session_dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        
-        for session_dir in session_dirs[:limit]:
-            conversation_file = session_dir / "conversation.json"
-            if conversation_file.exists():
+
+        # Sort by last write to the session (meta.json mtime), most recent first
+        def session_mtime(entry: Tuple[str, float]) -> float:
+            name, dir_mtime = entry
+            try:
+                return os.stat(os.path.join(str(self.base_path), name, "meta.json")).st_mtime
+            except OSError:
+                return dir_mtime
+
+        # O(N log limit) selection instead of sorting every session
+        selected = heapq.nlargest(limit, entries, key=session_mtime)
+        if not selected:
+            return []
+
+        # The per-session reads are independent small files; overlapping them
+        # hides the serial open/read latency. Ordering is preserved because
+        # the selection happens before the parallel map.
+        with ThreadPoolExecutor(max_workers=min(16, len(selected))) as executor:
+            rows = executor.map(self._load_session_summary, (name for name, _ in selected))
+
+        return [row for row in rows if row is not None]
+
+    def _load_session_summary(self, name: str) -> Optional[Dict]:
+        """
+        Build the listing row for one session directory.
+
+        Args:
+            name: Session directory name relative to the base path
+
+        Returns:
+            Session summary dictionary or None if the session is unreadable
+        """
+        session_dir = self.base_path / name
+        meta = self._read_meta(session_dir)
+        if meta is None:
+            # Legacy session without a sidecar: bounded header read
+            meta, exact = self._legacy_meta_preview(session_dir)
+            if meta is None:
+                return None
+            if exact:
+                # Computed from a complete parse: persist so later
+                # listings read only the sidecar. Backdate the sidecar's
+                # mtime so the session keeps its place in the sort order.
+                self._write_meta(session_dir, meta)
                 try:
-                    with open(conversation_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        sessions.append({
-                            "session_id": data.get("session_id", session_dir.name),
-                            "path": str(session_dir),
-                            "created_at": data.get("created_at"),
-                            "last_updated": data.get("last_updated"),
-                            "message_count": len(data.get("messages", [])),
-                            "first_user_message": next(
-                                (msg["content"] for msg in data.get("messages", []) 
-                                 if msg["role"] == "user"), 
-                                "No user message"
-                            )[:100]  # First 100 chars of first user message
-                        })
-                except (json.JSONDecodeError, IOError):
-                    continue
-        
-        return sessions
+                    legacy_mtime = (session_dir / "conversation.json").stat().st_mtime
+                    os.utime(session_dir / "meta.json", (legacy_mtime, legacy_mtime))
+                except OSError:
+                    pass
+
+        return {
+            "session_id": meta.get("session_id", session_dir.name),
+            "path": str(session_dir),
+            "created_at": meta.get("created_at"),
+            "last_updated": meta.get("last_updated"),
+            "message_count": meta.get("message_count", 0),
+            "first_user_message": meta.get("first_user_message", "No user message")
+        }
+
+    def _legacy_meta_preview(self, session_path: Path) -> Tuple[Optional[Dict], bool]:
+        """
+        Extract listing metadata from a legacy conversation.json without
+        parsing the whole file.
+
+        Reads the first 4 KiB; if that covers the whole file it is parsed
+        normally, otherwise the header fields are regex-extracted so listing
+        latency stays independent of conversation size.
+
+        Args:
+            session_path: Path to the session directory
+
+        Returns:
+            Tuple of (metadata dictionary or None, exact) where exact is
+            True only when the metadata came from a complete parse and is
+            safe to persist as a sidecar
+        """
+        legacy_file = session_path / "conversation.json"
+
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                head = f.read(4096)
+                complete = len(head) < 4096 or f.read(1) == ''
+        except IOError:
+            return None, False
+
+        if complete:
+            try:
+                data = _json_loads(head)
+            except ValueError:
+                return None, False
+            messages = data.get("messages", [])
+            return {
+                "session_id": data.get("session_id", session_path.name),
+                "created_at": data.get("created_at"),
+                "last_updated": data.get("last_updated"),
+                "message_count": len(messages),
+                "first_user_message": next(
+                    (self._first_user_preview(msg.get("content", ""))
+                     for msg in messages if msg.get("role") == "user"),
+                    "No user message"
+                )
+            }, True
+
+        # File is larger than the bounded read: pull header fields by regex.
+        # The message count is only a floor here, so this preview is never
+        # persisted as a sidecar.
+        meta = {"session_id": session_path.name, "message_count": 0}
+        for field in ("session_id", "created_at", "last_updated"):
+            match = re.search(r'"%s":\s*"([^"]*)"' % field, head)
+            if match:
+                meta[field] = match.group(1)
+        user_match = re.search(r'"role":\s*"user",\s*"content":\s*"([^"]*)"', head)
+        if user_match:
+            meta["first_user_message"] = user_match.group(1)[:100]
+        meta["message_count"] = head.count('"role":')
+        return meta, False
+
+    def get_session_data(self, session_path: Path) -> Optional[Dict]:
+        """
+        Get the full conversation data for a session in the legacy dict shape.
+
+        Handles both the JSONL + meta.json layout and legacy conversation.json.
+
+        Args:
+            session_path: Path to the session directory
+
+        Returns:
+            Dictionary with session_id, created_at, last_updated and messages,
+            or None if the session has no conversation data
+        """
+        meta = self._read_meta(session_path)
+        if meta is not None:
+            return {
+                "session_id": meta.get("session_id", session_path.name),
+                "created_at": meta.get("created_at"),
+                "last_updated": meta.get("last_updated"),
+                "messages": self.load_conversation(session_path)
+            }
+
+        return self._load_legacy_data(session_path)
     
     def clear_old_sessions(self, days: int = 30):
         """
@@ -290,20 +1025,35 @@ class ChatSessionManager:
         Args:
             days: Number of days to keep sessions
         """
-        if not self.base_path.exists():
-            return
-        
         current_time = time.time()
         cutoff_time = current_time - (days * 24 * 3600)
-        
-        for session_dir in self.base_path.iterdir():
-            if session_dir.is_dir():
-                # Check modification time
-                if session_dir.stat().st_mtime < cutoff_time:
-                    # Remove old session
-                    try:
-                        import shutil
-                        shutil.rmtree(session_dir)
-                        print(f"Removed old session: {session_dir.name}")
-                    except Exception as e:
-                        print(f"Error removing session {session_dir.name}: {e}")
\ No newline at end of file
+
+        removed = []
+        for name, mtime in self._iter_sessions():
+            # Check modification time
+            if mtime < cutoff_time:
+                # Remove old session
+                session_dir = self.base_path / name
+                try:
+                    self._remove_session_tree(session_dir)
+                    removed.append(name)
+                except Exception:
+                    _log.exception("Error removing session %s", name)
+
+        if removed:
+            _log.info("Removed %d old session(s): %s", len(removed), ", ".join(removed))
+
+    def _remove_session_tree(self, path: Path):
+        """
+        Remove a session directory tree, evicting it from the caches first.
+
+        Args:
+            path: Path to the session directory to remove
+        """
+        self._session_meta.pop(path, None)
+        self._conv_cache.pop(path, None)
+        self._last_saved_sig.pop(path, None)
+        if self._append_handle is not None and self._append_handle[0] == path:
+            self._close_append_handle()
+
+        shutil.rmtree(path)
\ No newline at end of file
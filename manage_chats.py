@@ -11,12 +11,37 @@ This script provides utilities to manage chat sessions:
 
 import argparse
 import json
+import logging
 import os
 import sys
-from datetime import datetime
 from pathlib import Path
 from chat_manager import ChatSessionManager
 
+# Per-role Markdown templates, hoisted so the export loop is a dict lookup
+# plus one format call per message
+_MD_TEMPLATES = {
+    'system': "### System Prompt\n\n{content}\n\n---\n\n",
+    'user': "### User{ts}\n\n{content}\n\n---\n\n",
+    'assistant': "### Assistant{ts}\n\n{content}\n\n---\n\n",
+}
+_MD_UNKNOWN_ROLE = "---\n\n"
+
+def _iso_to_short(iso: str, end: int = 16) -> str:
+    """
+    Reformat a writer-produced ISO timestamp (YYYY-MM-DDTHH:MM:SS.ffffff)
+    for display by slicing, avoiding a datetime parse + format per row.
+
+    Args:
+        iso: ISO timestamp string
+        end: Slice end for the time portion (16 for minutes, 19 for seconds)
+
+    Returns:
+        'YYYY-MM-DD HH:MM[:SS]', or the input unchanged if it doesn't match
+    """
+    if len(iso) >= end and iso[10] == 'T':
+        return iso[:10] + ' ' + iso[11:end]
+    return iso
+
 def list_sessions(manager: ChatSessionManager, limit: int = None):
     """List all chat sessions"""
     sessions = manager.get_recent_sessions(limit or 1000)
@@ -30,14 +55,8 @@ def list_sessions(manager: ChatSessionManager, limit: int = None):
     print("-" * 140)
     
     for i, session in enumerate(sessions, 1):
-        created = session.get('created_at', 'Unknown')
-        if created != 'Unknown':
-            try:
-                dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                created = dt.strftime('%Y-%m-%d %H:%M')
-            except:
-                pass
-        
+        created = _iso_to_short(session.get('created_at') or 'Unknown')
+
         print(f"{i:<4} {session['session_id'][:50]:<50} {created:<20} {session['message_count']:<10} {session['first_user_message'][:50]:<50}")
 
 def view_session(manager: ChatSessionManager, session_id: str):
@@ -54,23 +73,22 @@ def view_session(manager: ChatSessionManager, session_id: str):
         print("No messages found in this session.")
         return
     
-    print(f"\n=== Chat Session: {session_id} ===\n")
-    
+    # Build the transcript in memory and emit it with a single write
+    out = [f"\n=== Chat Session: {session_id} ===\n\n"]
+    separator = "-" * 80
+
     for msg in messages:
         role = msg['role'].upper()
         content = msg['content']
         timestamp = msg.get('timestamp', '')
-        
+
         if timestamp:
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                timestamp = dt.strftime(' [%Y-%m-%d %H:%M:%S]')
-            except:
-                timestamp = ''
-        
-        print(f"{role}{timestamp}:")
-        print(f"{content}")
-        print("-" * 80)
+            short = _iso_to_short(timestamp, end=19)
+            timestamp = f" [{short}]" if short != timestamp else ''
+
+        out.append(f"{role}{timestamp}:\n{content}\n{separator}\n")
+
+    sys.stdout.write(''.join(out))
 
 def export_session(manager: ChatSessionManager, session_id: str, output_format: str, output_file: str = None):
     """Export a chat session to different formats"""
@@ -80,15 +98,12 @@ def export_session(manager: ChatSessionManager, session_id: str, output_format:
         print(f"Error: Session '{session_id}' not found.")
         return
     
-    conversation_file = session_path / "conversation.json"
-    
-    if not conversation_file.exists():
+    data = manager.get_session_data(session_path)
+
+    if data is None:
         print("No conversation file found in this session.")
         return
-    
-    with open(conversation_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
+
     if output_file is None:
         output_file = f"{session_id}.{output_format}"
     
@@ -98,55 +113,53 @@ def export_session(manager: ChatSessionManager, session_id: str, output_format:
             json.dump(data, f, indent=2, ensure_ascii=False)
     
     elif output_format == 'txt':
-        # Export as plain text
+        # Export as plain text, assembled in memory and written in one call
+        separator = "-" * 80
+        parts = [
+            f"Chat Session: {data.get('session_id', 'Unknown')}\n",
+            f"Created: {data.get('created_at', 'Unknown')}\n",
+            f"Last Updated: {data.get('last_updated', 'Unknown')}\n",
+            "=" * 80 + "\n\n",
+        ]
+
+        for msg in data.get('messages', []):
+            role = msg['role'].upper()
+            content = msg['content']
+            timestamp = msg.get('timestamp', '')
+
+            if timestamp:
+                parts.append(f"\n[{timestamp}] ")
+            parts.append(f"{role}:\n{content}\n{separator}\n")
+
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"Chat Session: {data.get('session_id', 'Unknown')}\n")
-            f.write(f"Created: {data.get('created_at', 'Unknown')}\n")
-            f.write(f"Last Updated: {data.get('last_updated', 'Unknown')}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            for msg in data.get('messages', []):
-                role = msg['role'].upper()
-                content = msg['content']
-                timestamp = msg.get('timestamp', '')
-                
-                if timestamp:
-                    f.write(f"\n[{timestamp}] ")
-                f.write(f"{role}:\n{content}\n")
-                f.write("-" * 80 + "\n")
-    
+            f.writelines(parts)
+
     elif output_format == 'md':
-        # Export as Markdown
+        # Export as Markdown, assembled in memory and written in one call
+        parts = [
+            f"# Chat Session: {data.get('session_id', 'Unknown')}\n\n",
+            f"**Created:** {data.get('created_at', 'Unknown')}  \n",
+            f"**Last Updated:** {data.get('last_updated', 'Unknown')}\n\n",
+            "---\n\n",
+        ]
+
+        for msg in data.get('messages', []):
+            template = _MD_TEMPLATES.get(msg['role'], _MD_UNKNOWN_ROLE)
+            timestamp = msg.get('timestamp', '')
+            parts.append(template.format(
+                content=msg['content'],
+                ts=f" _{timestamp}_" if timestamp else ''
+            ))
+
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"# Chat Session: {data.get('session_id', 'Unknown')}\n\n")
-            f.write(f"**Created:** {data.get('created_at', 'Unknown')}  \n")
-            f.write(f"**Last Updated:** {data.get('last_updated', 'Unknown')}\n\n")
-            f.write("---\n\n")
-            
-            for msg in data.get('messages', []):
-                role = msg['role']
-                content = msg['content']
-                timestamp = msg.get('timestamp', '')
-                
-                if role == 'system':
-                    f.write(f"### System Prompt\n\n{content}\n\n")
-                elif role == 'user':
-                    f.write(f"### User")
-                    if timestamp:
-                        f.write(f" _{timestamp}_")
-                    f.write(f"\n\n{content}\n\n")
-                elif role == 'assistant':
-                    f.write(f"### Assistant")
-                    if timestamp:
-                        f.write(f" _{timestamp}_")
-                    f.write(f"\n\n{content}\n\n")
-                
-                f.write("---\n\n")
+            f.writelines(parts)
     
     print(f"Session exported to: {output_file}")
 
 def clean_sessions(manager: ChatSessionManager, days: int):
     """Clean up sessions older than specified days"""
+    # Surface the manager's removal summary log on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print(f"\nCleaning up sessions older than {days} days...")
     manager.clear_old_sessions(days)
     print("Cleanup complete.")
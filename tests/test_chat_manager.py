@@ -0,0 +1,300 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from chat_manager import ChatSessionManager
+
+
+class ChatSessionManagerTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.base_path = Path(self._tmpdir.name)
+        self.manager = ChatSessionManager(base_path=str(self.base_path))
+
+    def tearDown(self):
+        self.manager.close()
+        self._tmpdir.cleanup()
+
+    def read_jsonl(self, session_path):
+        conversation_file = session_path / "conversation.jsonl"
+        with open(conversation_file, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_new_session_creates_jsonl_and_meta(self):
+        session_path, messages = self.manager.get_or_create_session(
+            "hello there", "be helpful"
+        )
+
+        self.assertTrue((session_path / "conversation.jsonl").exists())
+        self.assertTrue((session_path / "meta.json").exists())
+        self.assertEqual(messages, [{"role": "system", "content": "be helpful"}])
+
+        with open(session_path / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.assertEqual(meta["session_id"], session_path.name)
+        self.assertEqual(meta["message_count"], 1)
+
+    def test_append_message_writes_one_line_per_message(self):
+        session_path, _ = self.manager.get_or_create_session("hi", "system")
+
+        self.manager.append_message("user", "hi", session_path)
+        self.manager.append_message("assistant", "hello", session_path)
+
+        lines = self.read_jsonl(session_path)
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[1]["role"], "user")
+        self.assertEqual(lines[2]["content"], "hello")
+
+    def test_save_conversation_appends_only_new_messages(self):
+        session_path, messages = self.manager.get_or_create_session("hi", "system")
+
+        messages.append({"role": "user", "content": "question"})
+        messages.append({"role": "assistant", "content": "answer"})
+        self.manager.save_conversation(session_path, messages)
+
+        self.assertEqual(len(self.read_jsonl(session_path)), 3)
+        self.assertEqual(self.manager.load_conversation(session_path), messages)
+
+        # Saving the same list again must not duplicate messages
+        self.manager.save_conversation(session_path, messages)
+        self.assertEqual(len(self.read_jsonl(session_path)), 3)
+
+    def test_load_conversation_cache_returns_fresh_copies(self):
+        session_path, _ = self.manager.get_or_create_session("hi", "system")
+        self.manager.append_message("user", "hi", session_path)
+
+        first = self.manager.load_conversation(session_path)
+        first.append({"role": "user", "content": "unsaved"})
+
+        # The cached copy must not see the caller's local mutation
+        second = self.manager.load_conversation(session_path)
+        self.assertEqual(len(second), 2)
+
+        # New appends from another manager instance are still picked up
+        other = ChatSessionManager(base_path=str(self.base_path))
+        self.addCleanup(other.close)
+        other.append_message("assistant", "hello", session_path)
+        self.assertEqual(len(self.manager.load_conversation(session_path)), 3)
+
+    def test_save_conversation_persists_in_place_system_prompt_edit(self):
+        session_path, messages = self.manager.get_or_create_session("hi", "old prompt")
+        messages.append({"role": "user", "content": "question"})
+        self.manager.save_conversation(session_path, messages)
+
+        # node.py mutates the persisted system message when the prompt changes
+        messages[0]["content"] = "new prompt"
+        self.manager.save_conversation(session_path, messages)
+
+        lines = self.read_jsonl(session_path)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]["content"], "new prompt")
+
+        # The rewrite survives a restart (fresh manager, cold caches)
+        other = ChatSessionManager(base_path=str(self.base_path))
+        self.assertEqual(other.load_conversation(session_path)[0]["content"], "new prompt")
+
+    def test_save_conversation_is_a_noop_when_unchanged(self):
+        from unittest.mock import patch
+
+        session_path, messages = self.manager.get_or_create_session("hi", "system")
+        messages.append({"role": "user", "content": "question"})
+        messages.append({"role": "assistant", "content": "answer"})
+        self.manager.save_conversation(session_path, messages)
+
+        with patch.object(self.manager, "_write_meta") as write_meta, \
+                patch.object(self.manager, "_append_lines") as append_lines:
+            self.manager.save_conversation(session_path, messages)
+
+        write_meta.assert_not_called()
+        append_lines.assert_not_called()
+
+        # A genuinely new message still gets persisted
+        messages.append({"role": "user", "content": "follow-up"})
+        self.manager.save_conversation(session_path, messages)
+        self.assertEqual(len(self.read_jsonl(session_path)), 4)
+
+    def test_load_conversation_reads_legacy_json(self):
+        session_path = self.base_path / "session_legacy"
+        session_path.mkdir()
+        legacy_messages = [
+            {"role": "system", "content": "system"},
+            {"role": "user", "content": "old question"},
+        ]
+        with open(session_path / "conversation.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "session_id": "session_legacy",
+                    "created_at": "2024-01-01T00:00:00",
+                    "last_updated": "2024-01-01T00:00:00",
+                    "messages": legacy_messages,
+                },
+                f,
+            )
+
+        self.assertEqual(self.manager.load_conversation(session_path), legacy_messages)
+
+    def test_save_conversation_migrates_legacy_session(self):
+        session_path = self.base_path / "session_legacy"
+        session_path.mkdir()
+        messages = [{"role": "system", "content": "system"}]
+        with open(session_path / "conversation.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "session_id": "session_legacy",
+                    "created_at": "2024-01-01T00:00:00",
+                    "last_updated": "2024-01-01T00:00:00",
+                    "messages": messages,
+                },
+                f,
+            )
+
+        messages = messages + [{"role": "user", "content": "new question"}]
+        self.manager.save_conversation(session_path, messages)
+
+        self.assertEqual(len(self.read_jsonl(session_path)), 2)
+        meta = self.manager._read_meta(session_path)
+        self.assertEqual(meta["created_at"], "2024-01-01T00:00:00")
+        self.assertEqual(meta["message_count"], 2)
+
+    def test_get_recent_sessions_reads_legacy_header_without_full_parse(self):
+        session_path = self.base_path / "session_legacy"
+        session_path.mkdir()
+        messages = [
+            {"role": "system", "content": "system"},
+            {"role": "user", "content": "legacy question"},
+            {"role": "assistant", "content": "x" * 8192},
+        ]
+        with open(session_path / "conversation.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "session_id": "session_legacy",
+                    "created_at": "2024-01-01T00:00:00",
+                    "last_updated": "2024-01-02T00:00:00",
+                    "messages": messages,
+                },
+                f,
+                indent=2,
+            )
+
+        sessions = self.manager.get_recent_sessions()
+
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(sessions[0]["session_id"], "session_legacy")
+        self.assertEqual(sessions[0]["created_at"], "2024-01-01T00:00:00")
+        self.assertEqual(sessions[0]["first_user_message"], "legacy question")
+
+    def test_image_attachments_are_stored_once_and_restored_on_load(self):
+        import base64
+
+        payload = base64.b64encode(b"fake-png-bytes").decode("ascii")
+        data_url = f"data:image/png;base64,{payload}"
+        image_message = {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "look at this"},
+                {"type": "image_url", "image_url": {"url": data_url}},
+            ],
+        }
+
+        session_path, messages = self.manager.get_or_create_session("look", "system")
+        messages.append(image_message)
+        self.manager.save_conversation(session_path, messages)
+
+        attachments = list((session_path / "attachments").iterdir())
+        self.assertEqual(len(attachments), 1)
+        self.assertEqual(attachments[0].read_bytes(), b"fake-png-bytes")
+
+        # The log stores a reference, not the base64 payload
+        with open(session_path / "conversation.jsonl", "r", encoding="utf-8") as f:
+            self.assertNotIn(payload, f.read())
+
+        # A fresh manager (empty cache) restores the inline data URL
+        other = ChatSessionManager(base_path=str(self.base_path))
+        loaded = other.load_conversation(session_path)
+        self.assertEqual(loaded[1]["content"][1]["image_url"]["url"], data_url)
+
+        # Re-attaching the same image on a later turn reuses the stored file
+        messages.append(dict(image_message))
+        self.manager.save_conversation(session_path, messages)
+        self.assertEqual(len(list((session_path / "attachments").iterdir())), 1)
+
+    def test_clear_old_sessions_removes_expired_trees(self):
+        import os
+        import time
+
+        session_path, _ = self.manager.get_or_create_session("old chat", "system")
+        self.manager.append_message("user", "old chat", session_path)
+
+        old_time = time.time() - 60 * 24 * 3600
+        os.utime(session_path, (old_time, old_time))
+
+        self.manager.clear_old_sessions(days=30)
+
+        self.assertFalse(session_path.exists())
+
+    def test_legacy_session_metadata_is_persisted_after_first_listing(self):
+        session_path = self.base_path / "session_legacy"
+        session_path.mkdir()
+        with open(session_path / "conversation.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "session_id": "session_legacy",
+                    "created_at": "2024-01-01T00:00:00",
+                    "last_updated": "2024-01-01T00:00:00",
+                    "messages": [
+                        {"role": "system", "content": "system"},
+                        {"role": "user", "content": "legacy question"},
+                    ],
+                },
+                f,
+            )
+
+        first = self.manager.get_recent_sessions()
+        self.assertTrue((session_path / "meta.json").exists())
+
+        second = self.manager.get_recent_sessions()
+        self.assertEqual(first, second)
+        self.assertEqual(second[0]["first_user_message"], "legacy question")
+        self.assertEqual(second[0]["message_count"], 2)
+
+    def test_per_session_caches_are_bounded(self):
+        from chat_manager import _CACHE_MAX_SESSIONS
+
+        for i in range(_CACHE_MAX_SESSIONS + 8):
+            session_path = self.base_path / f"session_{i:03d}"
+            session_path.mkdir()
+            self.manager.append_message("user", f"question {i}", session_path)
+            self.manager.load_conversation(session_path)
+
+        self.assertLessEqual(len(self.manager._conv_cache), _CACHE_MAX_SESSIONS)
+        self.assertLessEqual(len(self.manager._session_meta), _CACHE_MAX_SESSIONS)
+
+        # Evicted sessions are still readable from disk
+        evicted = self.base_path / "session_000"
+        self.assertNotIn(evicted, self.manager._conv_cache)
+        self.assertEqual(
+            self.manager.load_conversation(evicted)[0]["content"], "question 0"
+        )
+
+    def test_get_recent_sessions_with_zero_limit_returns_empty(self):
+        self.manager.get_or_create_session("hi", "system")
+        self.assertEqual(self.manager.get_recent_sessions(limit=0), [])
+
+    def test_get_recent_sessions_lists_metadata(self):
+        session_path, _ = self.manager.get_or_create_session("first question", "system")
+        self.manager.append_message("user", "first question", session_path)
+
+        sessions = self.manager.get_recent_sessions()
+
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(sessions[0]["session_id"], session_path.name)
+        self.assertEqual(sessions[0]["message_count"], 2)
+        self.assertEqual(sessions[0]["first_user_message"], "first question")
+
+
+if __name__ == "__main__":
+    unittest.main()